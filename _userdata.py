@@ -0,0 +1,2 @@
+# Generated by tools/gen_userdata.py from main.USER_DATA; do not edit.
+USER_DATA_B64 = "IyEvYmluL2Jhc2gKeXVtIHVwZGF0ZSAteSAmJiB5dW0gaW5zdGFsbCAteSBydWJ5IHdnZXQgaHR0cGQKc3lzdGVtY3RsIGVuYWJsZSAtLW5vdyBodHRwZAplY2hvICI8aDE+SGVsbG8gV29ybGQgVjEgZnJvbSAkKGhvc3RuYW1lIC1mKTwvaDE+IiA+IC92YXIvd3d3L2h0bWwvaW5kZXguaHRtbApjZCAvaG9tZS9lYzItdXNlcgp3Z2V0IGh0dHBzOi8vYXdzLWNvZGVkZXBsb3ktYXAtc291dGgtMS5zMy5hcC1zb3V0aC0xLmFtYXpvbmF3cy5jb20vbGF0ZXN0L2luc3RhbGwKY2htb2QgK3ggLi9pbnN0YWxsCi4vaW5zdGFsbCBhdXRvCnN5c3RlbWN0bCBlbmFibGUgLS1ub3cgY29kZWRlcGxveS1hZ2VudApta2RpciAtcCAvaG9tZS9lYzItdXNlci9teS1hcHBsaWNhdGlvbgpjaG93biAtUiBlYzItdXNlcjplYzItdXNlciAvaG9tZS9lYzItdXNlcgpjaG1vZCA3NTUgL2hvbWUvZWMyLXVzZXIK"
@@ -1,26 +1,37 @@
+import base64
+
 import pytest
 from cdktf import Testing
+from cdktf_cdktf_provider_aws.iam_role import IamRole
+from cdktf_cdktf_provider_aws.codedeploy_app import CodedeployApp
+
+import main
+from _userdata import USER_DATA_B64
+from main import MyStack, create_resource_tags
 
-# The tests below are example tests, you can find more information at
-# https://cdk.tf/testing
+# See https://cdk.tf/testing for more on the Testing helpers
 
 
 class TestMain:
 
-    def test_my_app(self):
-        assert True
+    stack       = MyStack(Testing.app(), "stack")
+    synthesized = Testing.synth(stack)
 
-    #stack = TerraformStack(Testing.app(), "stack")
-    #app_abstraction = MyApplicationsAbstraction(stack, "app-abstraction")
-    #synthesized = Testing.synth(stack)
+    def test_iam_roles_carry_base_tags(self):
+        assert Testing.to_have_resource_with_properties(self.synthesized, IamRole.TF_RESOURCE_TYPE, {
+            "tags": {"Project": "BlueGreen", "Environment": "Production", "ManagedBy": "CDKTF"},
+        })
 
-    # def test_should_contain_container(self):
-    #    assert Testing.to_have_resource(self.synthesized, Container.TF_RESOURCE_TYPE)
+    def test_should_contain_codedeploy_app(self):
+        assert Testing.to_have_resource(self.synthesized, CodedeployApp.TF_RESOURCE_TYPE)
 
-    # def test_should_use_an_ubuntu_image(self):
-    #    assert Testing.to_have_resource_with_properties(self.synthesized, Image.TF_RESOURCE_TYPE, {
-    #        "name": "ubuntu:latest",
-    #    })
+    def test_precomputed_user_data_matches_source(self):
+        # Fails when USER_DATA is edited without re-running tools/gen_userdata.py
+        assert base64.b64decode(USER_DATA_B64).decode("utf-8") == main.USER_DATA
 
-    # def test_check_validity(self):
-    #    assert Testing.to_be_valid_terraform(Testing.full_synth(stack))
+    def test_resource_tags_are_not_shared_between_calls(self):
+        base = {"Project": "BlueGreen"}
+        first = create_resource_tags(base, "vpc")
+        first["Owner"] = "someone"
+        assert create_resource_tags(base, "vpc") == {"Project": "BlueGreen", "Name": "vpc"}
+        assert base == {"Project": "BlueGreen"}
@@ -1,9 +1,11 @@
 #!/usr/bin/env python
-import uuid
-import base64
+import json
+import secrets
 from constructs import Construct
 from cdktf import App, TerraformStack, TerraformOutput
 
+from _userdata import USER_DATA_B64
+
 # CDKTF AWS Provider constructs
 from cdktf_cdktf_provider_aws.provider import AwsProvider
 from cdktf_cdktf_provider_aws.data_aws_ami import DataAwsAmi
@@ -23,12 +25,17 @@ from cdktf_cdktf_provider_aws.iam_role_policy import IamRolePolicy
 from cdktf_cdktf_provider_aws.iam_role_policy_attachment import IamRolePolicyAttachment
 from cdktf_cdktf_provider_aws.iam_instance_profile import IamInstanceProfile
 from cdktf_cdktf_provider_aws.lb import Lb
-from cdktf_cdktf_provider_aws.lb_target_group import LbTargetGroup
+from cdktf_cdktf_provider_aws.lb_target_group import LbTargetGroup, LbTargetGroupHealthCheck
 from cdktf_cdktf_provider_aws.lb_listener import LbListener, LbListenerDefaultAction
 from cdktf_cdktf_provider_aws.launch_template import LaunchTemplate
 from cdktf_cdktf_provider_aws.autoscaling_group import AutoscalingGroup, AutoscalingGroupTag
 from cdktf_cdktf_provider_aws.codedeploy_app import CodedeployApp
-from cdktf_cdktf_provider_aws.codedeploy_deployment_group import CodedeployDeploymentGroup
+from cdktf_cdktf_provider_aws.codedeploy_deployment_group import (
+    CodedeployDeploymentGroup,
+    CodedeployDeploymentGroupAutoRollbackConfiguration,
+    CodedeployDeploymentGroupBlueGreenDeploymentConfig,
+    CodedeployDeploymentGroupDeploymentStyle
+)
 
 # ─── Configuration Constants ────────────────────────────────────────────────────
 
@@ -37,7 +44,21 @@ VPC_CIDR           = "10.0.0.0/16"
 AVAILABILITY_ZONES = ["ap-south-1a", "ap-south-1b"]
 INSTANCE_TYPE      = "t3.micro"
 
-# Raw bootstrap script for EC2 instances
+# Per-AZ public subnet specs: (index, CIDR block, AZ, Name tag)
+_SUBNET_SPECS = tuple(
+    (i, f"10.0.{i}.0/24", az, f"public-subnet-{i}")
+    for i, az in enumerate(AVAILABILITY_ZONES, start=1)
+)
+
+# Amazon Linux 2 AMI lookup filters
+_AMI_FILTERS = (
+    {"name": "name",                "values": ["amzn2-ami-hvm-*-x86_64-gp2"]},
+    {"name": "virtualization-type", "values": ["hvm"]},
+    {"name": "root-device-type",    "values": ["ebs"]}
+)
+
+# Raw bootstrap script for EC2 instances. Not read at runtime: it is the source
+# for _userdata.py, so run tools/gen_userdata.py after editing it.
 USER_DATA = """#!/bin/bash
 yum update -y && yum install -y ruby wget httpd
 systemctl enable --now httpd
@@ -52,80 +73,135 @@ chown -R ec2-user:ec2-user /home/ec2-user
 chmod 755 /home/ec2-user
 """
 
-# Inline IAM policy documents
-CODEDEPLOY_ASSUME_ROLE_POLICY = """{
-  "Version":"2012-10-17",
-  "Statement":[{
-      "Action":"sts:AssumeRole",
-      "Effect":"Allow",
-      "Principal":{"Service":"codedeploy.amazonaws.com"}
-  }]
-}"""
-
-EC2_ASSUME_ROLE_POLICY = """{
-  "Version":"2012-10-17",
-  "Statement":[{
-      "Action":"sts:AssumeRole",
-      "Effect":"Allow",
-      "Principal":{"Service":"ec2.amazonaws.com"}
-  }]
-}"""
-
-CODEDEPLOY_AUTOSCALING_POLICY = """{
-  "Version":"2012-10-17",
-  "Statement":[{
-      "Effect":"Allow",
-      "Action":[
-          "autoscaling:*",
-          "ec2:CreateTags",
-          "ec2:RunInstances",
-          "iam:PassRole"
-      ],
-      "Resource":"*"
-  }]
-}"""
-
-EC2_S3_POLICY = """{
-  "Version":"2012-10-17",
-  "Statement":[{
-      "Effect":"Allow",
-      "Action":[
-          "s3:GetObject",
-          "s3:ListBucket"
-      ],
-      "Resource":[
-          "arn:aws:s3:::python-demo-application-deployment-bucket",
-          "arn:aws:s3:::python-demo-application-deployment-bucket/*"
-      ]
-  }]
-}"""
+# Inline IAM policy documents, serialized once at import with compact separators
+def _policy_json(statement: dict) -> str:
+    """Serialize a single-statement IAM policy document."""
+    return json.dumps(
+        {"Version": "2012-10-17", "Statement": [statement]},
+        separators=(",", ":")
+    )
+
+CODEDEPLOY_ASSUME_ROLE_POLICY = _policy_json({
+    "Action":    "sts:AssumeRole",
+    "Effect":    "Allow",
+    "Principal": {"Service": "codedeploy.amazonaws.com"}
+})
+
+EC2_ASSUME_ROLE_POLICY = _policy_json({
+    "Action":    "sts:AssumeRole",
+    "Effect":    "Allow",
+    "Principal": {"Service": "ec2.amazonaws.com"}
+})
+
+CODEDEPLOY_AUTOSCALING_POLICY = _policy_json({
+    "Effect": "Allow",
+    "Action": [
+        "autoscaling:*",
+        "ec2:CreateTags",
+        "ec2:RunInstances",
+        "iam:PassRole"
+    ],
+    "Resource": "*"
+})
+
+EC2_S3_POLICY = _policy_json({
+    "Effect": "Allow",
+    "Action": [
+        "s3:GetObject",
+        "s3:ListBucket"
+    ],
+    "Resource": [
+        "arn:aws:s3:::python-demo-application-deployment-bucket",
+        "arn:aws:s3:::python-demo-application-deployment-bucket/*"
+    ]
+})
 
 # ─── Helper Functions ───────────────────────────────────────────────────────────
 
 def create_resource_tags(base_tags: dict, name: str) -> dict:
     """Merge a common tags dictionary with a Name tag."""
-    return {**base_tags, "Name": f"{name}"}
+    tags = dict(base_tags)
+    tags["Name"] = name
+    return tags
+
+# Static part of every target group, shared by all stacks: do not mutate it
+# or its health check struct
+_TG_BASE = {
+    "port":        80,
+    "protocol":    "HTTP",
+    "target_type": "instance",
+    "health_check": LbTargetGroupHealthCheck(
+        enabled             = True,
+        interval            = 30,
+        path                = "/",
+        port                = "traffic-port",
+        healthy_threshold   = 2,
+        unhealthy_threshold = 2,
+        timeout             = 5,
+        matcher             = "200"
+    )
+}
 
 def create_target_group_config(name: str, unique: str, vpc_id: str, tags: dict) -> dict:
     """Build the kwargs for an Application Load Balancer target group."""
+    tg_name = f"{name}-tg"
     return {
-        "name":        f"{name}-tg-{unique}",
-        "port":        80,
-        "protocol":    "HTTP",
-        "vpc_id":      vpc_id,
-        "target_type": "instance",
-        "health_check": {
-            "enabled":             True,
-            "interval":            30,
-            "path":                "/",
-            "port":                "traffic-port",
-            "healthy_threshold":   2,
-            "unhealthy_threshold": 2,
-            "timeout":             5,
-            "matcher":             "200"
-        },
-        "tags": create_resource_tags(tags, f"{name}-tg")
+        **_TG_BASE,
+        "name":   f"{tg_name}-{unique}",
+        "vpc_id": vpc_id,
+        "tags":   create_resource_tags(tags, tg_name)
+    }
+
+# Public HTTP ingress rule for the ALB security group
+_HTTP_ANYWHERE_INGRESS = (
+    SecurityGroupIngress(
+        description = "HTTP from anywhere",
+        from_port   = 80, to_port = 80,
+        protocol    = "tcp",
+        cidr_blocks = ["0.0.0.0/0"]
+    ),
+)
+
+# Allow-all egress rule shared by every security group
+_EGRESS_ALL = (
+    SecurityGroupEgress(
+        description = "All outbound",
+        from_port   = 0, to_port = 0,
+        protocol    = "-1",
+        cidr_blocks = ["0.0.0.0/0"]
+    ),
+)
+
+# Static tags propagated to every blue ASG instance
+_BLUE_ASG_TAGS = (
+    AutoscalingGroupTag(key="Name",        value="blue-server", propagate_at_launch=True),
+    AutoscalingGroupTag(key="Environment", value="Production",  propagate_at_launch=True)
+)
+
+# Static CodeDeploy blue/green settings, built once as JSII structs
+# (the provider rejects MappingProxyType where it expects a dict)
+_BG_DEPLOYMENT_STYLE = CodedeployDeploymentGroupDeploymentStyle(
+    deployment_option = "WITH_TRAFFIC_CONTROL",
+    deployment_type   = "BLUE_GREEN"
+)
+
+_BG_CONFIG = CodedeployDeploymentGroupBlueGreenDeploymentConfig(
+    deployment_ready_option = {
+        "action_on_timeout": "CONTINUE_DEPLOYMENT"
+    },
+    green_fleet_provisioning_option = {
+        "action": "COPY_AUTO_SCALING_GROUP"
+    },
+    terminate_blue_instances_on_deployment_success = {
+        "action": "TERMINATE",
+        "termination_wait_time_in_minutes": 5
     }
+)
+
+_BG_AUTO_ROLLBACK = CodedeployDeploymentGroupAutoRollbackConfiguration(
+    enabled = True,
+    events  = ["DEPLOYMENT_FAILURE"]
+)
 
 # ─── Main Stack ────────────────────────────────────────────────────────────────
 
@@ -135,7 +211,8 @@ class MyStack(TerraformStack):
         super().__init__(scope, id)
 
         # Unique suffix for resource names & base tags
-        self.unique = uuid.uuid4().hex[:8]
+        self.unique = secrets.token_hex(4)
+        self._suf   = "-" + self.unique + "-"
         self.tags   = {
             "Project":     "BlueGreen",
             "Environment": "Production",
@@ -149,40 +226,38 @@ class MyStack(TerraformStack):
         ami = DataAwsAmi(self, "amazon_linux_2",
             most_recent = True,
             owners      = ["amazon"],
-            filter      = [
-                {"name": "name",                "values": ["amzn2-ami-hvm-*-x86_64-gp2"]},
-                {"name": "virtualization-type", "values": ["hvm"]},
-                {"name": "root-device-type",    "values": ["ebs"]}
-            ]
+            filter      = list(_AMI_FILTERS)
         )
 
-        # 3) Base64-encode the user data once
-        encoded_user_data = base64.b64encode(USER_DATA.encode("utf-8")).decode("utf-8")
-
-        # 4) Networking
+        # 3) Networking
         vpc            = self._create_vpc()
-        public_subnets = self._create_public_subnets(vpc)
-        self._create_internet_gateway(vpc, public_subnets)
+        public_rt      = self._create_internet_gateway(vpc)
+        public_subnets = self._create_public_subnets(vpc, public_rt)
+        subnet_ids     = [s.id for s in public_subnets]
+
+        # Steps 4 and 5 are independent of each other but must stay on this
+        # thread: the JSII client shares one synchronous pipe to the Node
+        # runtime, so concurrent construct calls would interleave requests.
 
-        # 5) Security Groups
+        # 4) Security Groups
         alb_sg, inst_sg = self._create_security_groups(vpc)
 
-        # 6) IAM Roles & Instance Profile
+        # 5) IAM Roles & Instance Profile
         cd_role      = self._create_codedeploy_role()
         inst_profile = self._create_ec2_role_and_profile()
 
-        # 7) ALB & Target Groups
-        alb, blue_tg, green_tg = self._create_load_balancer(public_subnets, alb_sg, vpc)
+        # 6) ALB & Target Groups
+        alb, blue_tg, green_tg = self._create_load_balancer(subnet_ids, alb_sg, vpc)
 
-        # 8) Auto Scaling Group with Base64-encoded user_data
+        # 7) Auto Scaling Group with Base64-encoded user_data
         asg_blue = self._create_auto_scaling_group(
-            inst_sg, inst_profile, blue_tg, public_subnets, ami.id, encoded_user_data
+            inst_sg, inst_profile, blue_tg, subnet_ids, ami.id, USER_DATA_B64
         )
 
-        # 9) CodeDeploy
+        # 8) CodeDeploy
         self._create_codedeploy_resources(cd_role, blue_tg, green_tg, asg_blue)
 
-        # 10) Outputs
+        # 9) Outputs
         self._create_outputs(vpc, alb)
 
 
@@ -197,19 +272,7 @@ class MyStack(TerraformStack):
             tags                 = create_resource_tags(self.tags, "vpc")
         )
 
-    def _create_public_subnets(self, vpc: Vpc) -> list[Subnet]:
-        return [
-            Subnet(self, f"subnet-public-{i+1}",
-                vpc_id                  = vpc.id,
-                cidr_block              = f"10.0.{i+1}.0/24",
-                availability_zone       = az,
-                map_public_ip_on_launch = True,
-                tags                    = create_resource_tags(self.tags, f"public-subnet-{i+1}")
-            )
-            for i, az in enumerate(AVAILABILITY_ZONES)
-        ]
-
-    def _create_internet_gateway(self, vpc: Vpc, subnets: list[Subnet]) -> None:
+    def _create_internet_gateway(self, vpc: Vpc) -> RouteTable:
         igw = InternetGateway(self, "igw-main",
             vpc_id = vpc.id,
             tags   = create_resource_tags(self.tags, "igw")
@@ -223,34 +286,40 @@ class MyStack(TerraformStack):
             destination_cidr_block = "0.0.0.0/0",
             gateway_id             = igw.id
         )
-        for i, subnet in enumerate(subnets):
-            RouteTableAssociation(self, f"rt-assoc-public-{i+1}",
+        return rt
+
+    def _create_public_subnets(self, vpc: Vpc, rt: RouteTable) -> list[Subnet]:
+        # Local aliases keep global and JSII property lookups out of the loop
+        subnet_cls, assoc_cls = Subnet, RouteTableAssociation
+        make_tags, tags       = create_resource_tags, self.tags
+        vpc_id, rt_id         = vpc.id, rt.id
+        subnets = []
+        for idx, cidr, az, name in _SUBNET_SPECS:
+            subnet = subnet_cls(self, f"subnet-public-{idx}",
+                vpc_id                  = vpc_id,
+                cidr_block              = cidr,
+                availability_zone       = az,
+                map_public_ip_on_launch = True,
+                tags                    = make_tags(tags, name)
+            )
+            assoc_cls(self, f"rt-assoc-public-{idx}",
                 subnet_id      = subnet.id,
-                route_table_id = rt.id
+                route_table_id = rt_id
             )
+            subnets.append(subnet)
+        return subnets
 
     def _create_security_groups(self, vpc: Vpc) -> tuple[SecurityGroup, SecurityGroup]:
-        egress_all = [SecurityGroupEgress(
-            description = "All outbound",
-            from_port   = 0, to_port = 0,
-            protocol    = "-1",
-            cidr_blocks = ["0.0.0.0/0"]
-        )]
         alb_sg = SecurityGroup(self, "sg-alb",
-            name_prefix = f"alb-sg-{self.unique}-",
+            name_prefix = "alb-sg" + self._suf,
             vpc_id       = vpc.id,
             description  = "Allow HTTP to ALB",  # ASCII only
-            ingress      = [SecurityGroupIngress(
-                description = "HTTP from anywhere",
-                from_port   = 80, to_port = 80,
-                protocol    = "tcp",
-                cidr_blocks = ["0.0.0.0/0"]
-            )],
-            egress       = egress_all,
+            ingress      = list(_HTTP_ANYWHERE_INGRESS),
+            egress       = list(_EGRESS_ALL),
             tags         = create_resource_tags(self.tags, "alb-sg")
         )
         inst_sg = SecurityGroup(self, "sg-instance",
-            name_prefix = f"instance-sg-{self.unique}-",
+            name_prefix = "instance-sg" + self._suf,
             vpc_id       = vpc.id,
             description  = "Allow HTTP from ALB",
             ingress      = [SecurityGroupIngress(
@@ -259,14 +328,14 @@ class MyStack(TerraformStack):
                 protocol        = "tcp",
                 security_groups = [alb_sg.id]
             )],
-            egress       = egress_all,
+            egress       = list(_EGRESS_ALL),
             tags         = create_resource_tags(self.tags, "instance-sg")
         )
         return alb_sg, inst_sg
 
     def _create_codedeploy_role(self) -> IamRole:
         role = IamRole(self, "role-codedeploy",
-            name               = f"cd-role-{self.unique}",
+            name               = "cd-role-" + self.unique,
             assume_role_policy = CODEDEPLOY_ASSUME_ROLE_POLICY,
             tags               = self.tags
         )
@@ -283,7 +352,7 @@ class MyStack(TerraformStack):
 
     def _create_ec2_role_and_profile(self) -> IamInstanceProfile:
         role = IamRole(self, "role-ec2",
-            name               = f"ec2-role-{self.unique}",
+            name               = "ec2-role-" + self.unique,
             assume_role_policy = EC2_ASSUME_ROLE_POLICY,
             tags               = self.tags
         )
@@ -297,17 +366,17 @@ class MyStack(TerraformStack):
             policy_arn = "arn:aws:iam::aws:policy/AmazonSSMManagedInstanceCore"
         )
         return IamInstanceProfile(self, "profile-ec2",
-            name = f"ec2-profile-{self.unique}",
+            name = "ec2-profile-" + self.unique,
             role = role.name
         )
 
-    def _create_load_balancer(self, subnets: list[Subnet], alb_sg: SecurityGroup, vpc: Vpc):
+    def _create_load_balancer(self, subnet_ids: list[str], alb_sg: SecurityGroup, vpc: Vpc):
         alb = Lb(self, "alb-app",
-            name               = f"app-alb-{self.unique}",
+            name               = "app-alb-" + self.unique,
             internal           = False,
             load_balancer_type = "application",
             security_groups    = [alb_sg.id],
-            subnets            = [s.id for s in subnets],
+            subnets            = subnet_ids,
             tags               = create_resource_tags(self.tags, "alb")
         )
         blue_tg = LbTargetGroup(self, "tg-blue", **create_target_group_config(
@@ -316,24 +385,20 @@ class MyStack(TerraformStack):
         green_tg = LbTargetGroup(self, "tg-green", **create_target_group_config(
             "green", self.unique, vpc.id, self.tags
         ))
-        LbListener(self, "listener-prod",
-            load_balancer_arn = alb.arn,
-            port              = 80,
-            protocol          = "HTTP",
-            default_action    = [LbListenerDefaultAction(
-                type             = "forward",
-                target_group_arn = blue_tg.arn
-            )]
-        )
-        LbListener(self, "listener-test",
-            load_balancer_arn = alb.arn,
-            port              = 8080,
-            protocol          = "HTTP",
-            default_action    = [LbListenerDefaultAction(
-                type             = "forward",
-                target_group_arn = green_tg.arn
-            )]
-        )
+        alb_arn = alb.arn
+        for listener_id, port, tg in (
+            ("listener-prod", 80,   blue_tg),
+            ("listener-test", 8080, green_tg)
+        ):
+            LbListener(self, listener_id,
+                load_balancer_arn = alb_arn,
+                port              = port,
+                protocol          = "HTTP",
+                default_action    = [LbListenerDefaultAction(
+                    type             = "forward",
+                    target_group_arn = tg.arn
+                )]
+            )
         return alb, blue_tg, green_tg
 
     def _create_auto_scaling_group(
@@ -341,12 +406,12 @@ class MyStack(TerraformStack):
         inst_sg: SecurityGroup,
         inst_profile: IamInstanceProfile,
         blue_tg: LbTargetGroup,
-        subnets: list[Subnet],
+        subnet_ids: list[str],
         ami_id: str,
         encoded_user_data: str
     ) -> AutoscalingGroup:
         lt = LaunchTemplate(self, "lt-app-blue",
-            name_prefix            = f"app-lt-blue-{self.unique}-",
+            name_prefix            = "app-lt-blue" + self._suf,
             image_id               = ami_id,
             instance_type          = INSTANCE_TYPE,
             vpc_security_group_ids = [inst_sg.id],
@@ -355,19 +420,16 @@ class MyStack(TerraformStack):
             tags                   = create_resource_tags(self.tags, "lt-blue")
         )
         return AutoscalingGroup(self, "asg-blue",
-            name                      = f"asg-blue-{self.unique}",
+            name                      = "asg-blue-" + self.unique,
             desired_capacity          = 2,
             min_size                  = 1,
             max_size                  = 4,
-            vpc_zone_identifier       = [s.id for s in subnets],
+            vpc_zone_identifier       = subnet_ids,
             target_group_arns         = [blue_tg.arn],
             health_check_type         = "ELB",
             health_check_grace_period = 300,
             launch_template           = {"id": lt.id, "version": "$Latest"},
-            tag                       = [
-                AutoscalingGroupTag(key="Name",        value="blue-server", propagate_at_launch=True),
-                AutoscalingGroupTag(key="Environment", value="Production",      propagate_at_launch=True)
-            ]
+            tag                       = list(_BLUE_ASG_TAGS)
         )
 
     def _create_codedeploy_resources(
@@ -378,34 +440,17 @@ class MyStack(TerraformStack):
         asg_blue: AutoscalingGroup
     ) -> None:
         app = CodedeployApp(self, "codedeploy-app",
-            name             = f"app-{self.unique}",
+            name             = "app-" + self.unique,
             compute_platform = "Server",
             tags             = self.tags
         )
         CodedeployDeploymentGroup(self, "cd-deployment-group",
             app_name                       = app.name,
-            deployment_group_name          = f"deploy-grp-{self.unique}",
+            deployment_group_name          = "deploy-grp-" + self.unique,
             service_role_arn               = cd_role.arn,
-            deployment_style               = {
-                "deployment_option": "WITH_TRAFFIC_CONTROL",
-                "deployment_type":   "BLUE_GREEN"
-            },
-            blue_green_deployment_config   = {
-                "deployment_ready_option": {
-                    "action_on_timeout": "CONTINUE_DEPLOYMENT"
-                },
-                "green_fleet_provisioning_option": {
-                    "action": "COPY_AUTO_SCALING_GROUP"
-                },
-                "terminate_blue_instances_on_deployment_success": {
-                    "action": "TERMINATE",
-                    "termination_wait_time_in_minutes": 5
-                }
-            },
-            auto_rollback_configuration     = {
-                "enabled": True,
-                "events":  ["DEPLOYMENT_FAILURE"]
-            },
+            deployment_style               = _BG_DEPLOYMENT_STYLE,
+            blue_green_deployment_config   = _BG_CONFIG,
+            auto_rollback_configuration     = _BG_AUTO_ROLLBACK,
             load_balancer_info             = {
                 "target_group_info": [
                     {"name": blue_tg.name},
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Regenerate _userdata.py from the USER_DATA script defined in main.py.
+
+Run after editing USER_DATA:  python tools/gen_userdata.py
+Verify it is up to date:      python tools/gen_userdata.py --check
+main.py is parsed, not imported, so this works without cdktf installed.
+"""
+import argparse
+import ast
+import base64
+import sys
+from pathlib import Path
+
+ROOT   = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "main.py"
+TARGET = ROOT / "_userdata.py"
+
+TEMPLATE = '''# Generated by tools/gen_userdata.py from main.USER_DATA; do not edit.
+USER_DATA_B64 = "{encoded}"
+'''
+
+def read_user_data(path: Path) -> str:
+    """Return the literal value assigned to USER_DATA in the given module."""
+    for node in ast.parse(path.read_text()).body:
+        if (isinstance(node, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "USER_DATA" for t in node.targets)):
+            return ast.literal_eval(node.value)
+    raise SystemExit(f"USER_DATA not found in {path}")
+
+def render() -> str:
+    """Return the expected contents of _userdata.py."""
+    encoded = base64.b64encode(read_user_data(SOURCE).encode("utf-8")).decode("ascii")
+    return TEMPLATE.format(encoded=encoded)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true",
+                        help="exit 1 if _userdata.py is out of date instead of rewriting it")
+    args = parser.parse_args(argv)
+
+    expected = render()
+    if args.check:
+        if not TARGET.exists() or TARGET.read_text() != expected:
+            print(f"{TARGET.relative_to(ROOT)} is out of date; run tools/gen_userdata.py",
+                  file=sys.stderr)
+            return 1
+        return 0
+    TARGET.write_text(expected)
+    print(f"Wrote {TARGET.relative_to(ROOT)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())